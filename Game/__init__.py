@@ -0,0 +1,33 @@
+import importlib
+
+# Public names and the submodule that defines them. Submodules are imported on
+# first attribute access so that importing the package never pulls in torch or eval7.
+_EXPORTS = {
+    "Deck": "Game.deck",
+    "Game": "Game.game",
+    "GameState": "Game.state",
+    "GameLogger": "Game.logger",
+    "Poker": "Game.poker",
+    "Player": "Game.player",
+    "DeepCFRModel": "Game.nn",
+    "Trainer": "Game.trainer",
+    "StrategyTable": "Game.strategy_table",
+    "TablePlayer": "Game.strategy_table",
+    "export_strategy_table": "Game.strategy_table",
+    "SubgameResolver": "Game.resolver",
+    "ResolvingPlayer": "Game.resolver",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'Game' has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
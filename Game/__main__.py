@@ -0,0 +1,77 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# The pure-rules path used by simulation workers; none of these may import torch
+RULES_MODULES = ["Game.deck", "Game.game", "Game.state"]
+HEAVY_MODULES = ["torch", "eval7"]
+
+# Imports the modules, deals from a Deck and reports the heavy modules loaded; dealing needs neither
+WORKER = (
+    "import sys, json\n"
+    "{imports}\n"
+    "import Game.deck\n"
+    "Game.deck.Deck().deal(7)\n"
+    "print(json.dumps([m for m in {heavy!r} if m in sys.modules]))\n"
+)
+
+
+def time_process(code, runs):
+    """
+    Run a fresh interpreter on the code several times and time it.
+
+    Parameters:
+    code (str): Source passed to python -c.
+    runs (int): Number of runs.
+
+    Returns:
+    tuple: (median wall time in seconds, stdout of the last run).
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [root, os.environ.get("PYTHONPATH")])))
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result.stdout
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m Game",
+        description="Measure the cold start time of a rules-only simulation worker.",
+    )
+    parser.add_argument(
+        "modules", nargs="*", default=RULES_MODULES,
+        help="Modules the worker imports (default: the rules-only path).",
+    )
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per measurement.")
+    parser.add_argument(
+        "--budget-ms", type=float, default=100.0,
+        help="Fail if the worker cold start exceeds this many milliseconds.",
+    )
+    args = parser.parse_args(argv)
+
+    baseline, _ = time_process("pass", args.runs)
+    imports = "\n".join(f"import {module}" for module in args.modules)
+    worker, output = time_process(WORKER.format(imports=imports, heavy=HEAVY_MODULES), args.runs)
+    loaded = json.loads(output)
+
+    print(f"{'interpreter':<24} {baseline * 1000:8.2f} ms")
+    print(f"{'worker cold start':<24} {worker * 1000:8.2f} ms")
+    print(f"{'  of which Game + deal':<24} {(worker - baseline) * 1000:8.2f} ms")
+    print(f"Heavy dependencies loaded: {', '.join(loaded) if loaded else 'none'}")
+
+    if worker * 1000 > args.budget_ms:
+        print(f"Cold start exceeds budget of {args.budget_ms:.0f} ms.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,51 @@
 import random 
-import eval7 
+
+RANKS = "23456789TJQKA"
+SUITS = "cdhs"
+# Every card, ordered by card_index
+CARDS = [rank + suit for rank in RANKS for suit in SUITS]
+# Card name -> eval7.Card, filled on the first evaluation
+_EVAL7_CARDS = {}
+
+
+def card_index(card):
+    """
+    Map a card to the 0-51 index used by the model's card embeddings (rank * 4 + suit).
+
+    Parameters:
+    card (eval7.Card or str): The card, e.g. "As".
+
+    Returns:
+    int: The card index.
+    """
+    name = str(card)
+    return 4 * RANKS.index(name[0]) + SUITS.index(name[1])
+
+
+def hand_rank(cards):
+    """
+    Evaluate a hand with eval7.
+
+    Parameters:
+    cards (list): The cards making up the hand (strings like "As" or eval7.Card objects).
+
+    Returns:
+    int: The hand rank (higher is better).
+    """
+    import eval7  # Only evaluation needs eval7; dealing stays off it
+
+    if not _EVAL7_CARDS:
+        _EVAL7_CARDS.update((name, eval7.Card(name)) for name in CARDS)
+    return eval7.evaluate([_EVAL7_CARDS[str(card)] for card in cards])
+
 
 class Deck: 
     def __init__(self): 
         '''
-        Initializes a full deck of cards using eval7 and shuffles it
+        Initializes a full deck of cards as strings like "As" and shuffles it.
+        Cards only become eval7 cards inside hand_rank, so dealing never imports eval7.
         '''
-        self.cards = list(eval7.Deck()) # Creates a deck object
+        self.cards = list(CARDS)
         self.shuffle()  # Shuffles the deck upon ititialization 
 
     def shuffle(self): 
@@ -19,7 +58,7 @@ class Deck:
         '''
         Deals the top card from the deck.
         Returns: 
-            - eval7.Card: the top card
+            - list: the dealt cards, as strings like "As"
         '''
         if num_cards > len(self.cards): 
             raise ValueError('Not enough cards left in the deck to deal.')
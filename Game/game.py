@@ -1,7 +1,6 @@
-from Game.deck import Deck 
-from Game.player import Player 
-from Game.logging import GameLogger
-import eval7
+from Game.deck import Deck, card_index, hand_rank
+from Game.poker import Poker
+from Game.state import GameState
 
 class Game:
     def __init__(self, players, ante, small_bet, big_bet, logger, bring_in=None):
@@ -26,6 +25,8 @@ class Game:
         self.logger = logger
         self.current_round = "third_street"  # Start at third street
         self.active_players = players.copy()  # Players still in the hand
+        # Pot, action history and upcards as the players see them; folded players are dropped
+        self.state = GameState(players.copy())
 
     def ante_up(self):
         """
@@ -34,6 +35,7 @@ class Game:
         for player in self.players:
             player.chips -= self.ante
             self.pot += self.ante
+            self.state.update_pot(self.ante)
             self.logger.info(f"{player.name} pays ante of {self.ante}. Chips left: {player.chips}")
 
     def deal_card(self):
@@ -43,6 +45,8 @@ class Game:
         for player in self.active_players:
             card = self.deck.deal(1)[0]  # Deal one card
             player.hand.append(card)
+            if 3 <= len(player.hand) <= 6:  # The third to sixth cards are dealt face up
+                self.state.update_visible_cards(player, card)
             self.logger.info(f"{player.name} receives a card: {card}")
 
     def determine_bring_in(self):
@@ -50,50 +54,55 @@ class Game:
         Determine the bring-in player based on the lowest visible card.
         If multiple players have the same lowest card, use suit rankings.
         """
-        lowest_card = None
-        bring_in_player = None
-        for player in self.active_players:
-            visible_card = player.hand[2]  # Upcard is the third card dealt
-            if not lowest_card or (
-                visible_card < lowest_card or
-                (visible_card == lowest_card and player < bring_in_player)
-            ):
-                lowest_card = visible_card
-                bring_in_player = player
-        return bring_in_player
+        # card_index orders by rank, then suit (clubs lowest), so ties in rank are broken by suit
+        return min(self.active_players, key=lambda player: card_index(player.hand[2]))  # Upcard is the third card dealt
 
     def betting_round(self, bet_limit):
         """
-        Execute a betting round.
+        Execute a betting round, recording every action and bet in the game state.
+        Players are asked for an action with the game state passed as state.
+
         Parameters:
         bet_limit (int): The maximum bet/raise for this round.
         """
         current_bet = 0
-        action_done = [False] * len(self.active_players)
-
-        while not all(action_done):
-            for i, player in enumerate(self.active_players):
-                if action_done[i]:
-                    continue
-                action = player.take_action(current_bet, bet_limit)
-                if action == "fold":
-                    self.logger.info(f"{player.name} folds.")
-                    self.active_players.remove(player)
-                elif action == "call":
-                    call_amount = current_bet - player.current_bet
-                    player.chips -= call_amount
-                    self.pot += call_amount
-                    player.current_bet += call_amount
-                    self.logger.info(f"{player.name} calls {call_amount}. Chips left: {player.chips}")
-                elif action == "raise":
-                    raise_amount = bet_limit
-                    current_bet += raise_amount
-                    player.chips -= current_bet - player.current_bet
-                    self.pot += current_bet - player.current_bet
-                    player.current_bet = current_bet
-                    action_done = [False] * len(self.active_players)  # Reset actions
-                    self.logger.info(f"{player.name} raises to {current_bet}. Chips left: {player.chips}")
-                action_done[i] = True
+        raises = 0
+        for player in self.active_players:
+            player.current_bet = 0
+        to_act = list(self.active_players)
+
+        while to_act and len(self.active_players) > 1:
+            player = to_act.pop(0)
+            legal_actions = ["fold", "call", "raise"] if raises < Poker.max_raises else ["fold", "call"]
+            visible_cards = [
+                card for other in self.active_players if other is not player
+                for card in self.state.get_visible_hand(other)
+            ]
+            action = player.take_action(current_bet, self.pot, visible_cards, legal_actions, state=self.state)
+            amount = 0
+            if action == "call":
+                amount = current_bet - player.current_bet
+            elif action == "raise":
+                current_bet += bet_limit
+                amount = current_bet - player.current_bet
+                raises += 1
+                # Everyone else acts again, in seat order after the raiser
+                seat = self.active_players.index(player)
+                to_act = self.active_players[seat + 1:] + self.active_players[:seat]
+            player.chips -= amount
+            player.current_bet += amount
+            self.pot += amount
+
+            if action == "fold":
+                self.logger.info(f"{player.name} folds.")
+                self.active_players.remove(player)
+                self.state.players.remove(player)
+            elif action == "call":
+                self.logger.info(f"{player.name} calls {amount}. Chips left: {player.chips}")
+            else:
+                self.logger.info(f"{player.name} raises to {current_bet}. Chips left: {player.chips}")
+            self.state.add_action(player, action, amount)
+            self.state.update_pot(amount)
 
     def determine_highest_hand(self):
         """
@@ -104,12 +113,25 @@ class Game:
         acting_player = None
         for player in self.active_players:
             visible_hand = player.get_visible_hand()
-            hand_rank = eval7.HandEvaluator.evaluate(visible_hand)
+            hand_rank = self.hand_rank(visible_hand)
             if not highest_hand or hand_rank > highest_hand:
                 highest_hand = hand_rank
                 acting_player = player
         return acting_player
 
+    @staticmethod
+    def hand_rank(cards):
+        """
+        Evaluate a hand for showdown.
+
+        Parameters:
+        cards (list): The cards making up the hand (strings like "As" or eval7.Card objects).
+
+        Returns:
+        int: The hand rank (higher is better).
+        """
+        return hand_rank(cards)
+
     def showdown(self):
         """
         Compare hands and determine the winner of the pot.
@@ -117,7 +139,7 @@ class Game:
         best_hand = None
         winner = None
         for player in self.active_players:
-            hand_rank = eval7.HandEvaluator.evaluate(player.hand)
+            hand_rank = self.hand_rank(player.hand)
             if not best_hand or hand_rank > best_hand:
                 best_hand = hand_rank
                 winner = player
@@ -140,11 +162,20 @@ class Game:
         # Betting rounds
         for street in ["third_street", "fourth_street", "fifth_street", "sixth_street", "seventh_street"]:
             self.current_round = street
+            if street != "third_street":
+                self.state.next_round()
             self.betting_round(self.small_bet if street in ["third_street", "fourth_street"] else self.big_bet)
+            if len(self.active_players) == 1:
+                break
             if street != "seventh_street":
                 self.deal_card()
 
-        # Showdown
+        # Showdown, unless everyone else folded
         if len(self.active_players) > 1:
             self.showdown()
+        else:
+            winner = self.active_players[0]
+            winner.chips += self.pot
+            self.logger.info(f"{winner.name} wins the pot of {self.pot} uncontested.")
+            self.pot = 0
 
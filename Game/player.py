@@ -1,5 +1,6 @@
 import random
-import torch
+
+from Game.deck import card_index
 
 class Player:
     def __init__(self, name, chips, model, device="cpu"):
@@ -40,17 +41,19 @@ class Player:
         Returns:
         torch.Tensor: Encoded game state as a tensor.
         """
+        import torch  # Loaded on first model use so rules-only code stays torch-free
+
         # Example state encoding: visible cards, current bet, pot size, and player chips
         encoded_state = {
-            "cards": torch.tensor([card.index for card in self.hand], dtype=torch.long, device=self.device),
-            "visible_cards": torch.tensor([card.index for card in visible_cards], dtype=torch.long, device=self.device),
+            "cards": torch.tensor([card_index(card) for card in self.hand], dtype=torch.long, device=self.device),
+            "visible_cards": torch.tensor([card_index(card) for card in visible_cards], dtype=torch.long, device=self.device),
             "current_bet": torch.tensor([current_bet], dtype=torch.float32, device=self.device),
             "pot": torch.tensor([pot], dtype=torch.float32, device=self.device),
             "chips": torch.tensor([self.chips], dtype=torch.float32, device=self.device),
         }
         return encoded_state
 
-    def take_action(self, current_bet, pot, visible_cards, legal_actions):
+    def take_action(self, current_bet, pot, visible_cards, legal_actions, state=None):
         """
         Determine the player's action based on the CFR neural network probabilities.
 
@@ -59,10 +62,13 @@ class Player:
         pot (int): The total chips in the pot.
         visible_cards (list): The visible cards on the table.
         legal_actions (list): Legal actions available to the player (e.g., ["fold", "call", "raise"]).
+        state (GameState): The game state passed by Game (unused by the blueprint).
 
         Returns:
         str: The chosen action.
         """
+        import torch
+
         # Encode the game state
         state = self.encode_state(current_bet, pot, visible_cards)
 
@@ -11,6 +11,9 @@ class Poker:
         'seventh_street': 7
     } 
 
+    # Bets and raises allowed in one betting round
+    max_raises = 3
+
     # Possible actions in a poker game 
     game_actions = {
         'fold': 0,
@@ -0,0 +1,680 @@
+import argparse
+import itertools
+import math
+import operator
+import random
+import time
+
+from Game.deck import CARDS
+from Game.game import Game
+from Game.player import Player
+from Game.poker import Poker
+from Game.state import GameState
+
+HERO, OPP = 0, 1
+LATE_STREETS = ("sixth_street", "seventh_street")
+
+
+class _Node:
+    def __init__(self, actor=None, actions=(), children=(), fold_by=None, hero_in=0, opp_in=0):
+        """
+        A node of the re-solved betting subtree.
+
+        Parameters:
+        actor (int): HERO or OPP for decision nodes, None for terminals.
+        actions (tuple): Action names of a decision node.
+        children (tuple): Child nodes, aligned with actions.
+        fold_by (int): The player who folded, None for a showdown terminal.
+        hero_in (int): Chips the hero has added to the pot inside the subtree.
+        opp_in (int): Chips the opponent has added to the pot inside the subtree.
+        """
+        self.actor = actor
+        self.actions = actions
+        self.children = children
+        self.fold_by = fold_by
+        self.hero_in = hero_in
+        self.opp_in = opp_in
+        self.regrets = None  # One column per action, one value per combo of the actor
+        self.strategy_sum = None
+
+
+def _canonical(cards):
+    """
+    Order a hole card combo so the same cards always form the same tuple.
+    """
+    return tuple(sorted(cards, key=str))
+
+
+class _Showdown:
+    def __init__(self, blocked, wins):
+        """
+        Showdown matrices of a subgame with cached products against reach vectors.
+
+        Parameters:
+        blocked (list): blocked[h][o] is the share of hero and opponent hole cards in
+                        group h and o that have no card in common (1 or 0 for single combos).
+        wins (list): wins[h][o] is blocked[h][o] times the hero's showdown equity.
+        """
+        self.blocked = blocked
+        self.wins = wins
+        self.blocked_t = [list(column) for column in zip(*blocked)]
+        self.wins_t = [list(column) for column in zip(*wins)]
+        self._cache = {}
+
+    def clear(self):
+        """
+        Drop cached products; reach vectors are rebuilt every iteration.
+        """
+        self._cache.clear()
+
+    def against_opponent(self, opp_reach, matrix="blocked"):
+        """
+        Parameters:
+        opp_reach (list): Reach probability per opponent group.
+        matrix (str): "blocked" or "wins".
+
+        Returns:
+        list: matrix @ opp_reach, one value per hero group.
+        """
+        return self._product(opp_reach, matrix)
+
+    def against_hero(self, hero_reach, matrix="blocked"):
+        """
+        Parameters:
+        hero_reach (list): Reach probability per hero group.
+        matrix (str): "blocked" or "wins".
+
+        Returns:
+        list: hero_reach @ matrix, one value per opponent group.
+        """
+        return self._product(hero_reach, matrix + "_t")
+
+    def _product(self, reach, matrix):
+        # Sibling terminals share the same reach list, so products are cached by identity.
+        # The cache holds the list itself, which keeps its id from being reused.
+        key = (id(reach), matrix)
+        cached = self._cache.get(key)
+        if cached is None:
+            product = [sum(map(operator.mul, row, reach)) for row in getattr(self, matrix)]
+            cached = self._cache[key] = (reach, product)
+        return cached[1]
+
+    def pooled(self, hero_sizes, opp_sizes):
+        """
+        Average the matrices over consecutive blocks of rows and columns.
+
+        Parameters:
+        hero_sizes (list): Rows per hero group.
+        opp_sizes (list): Columns per opponent group.
+
+        Returns:
+        _Showdown: Matrices of one row per hero group and one column per opponent group.
+        """
+        def pool(matrix):
+            rows, start = [], 0
+            for size in hero_sizes:
+                row = [sum(column) / size for column in zip(*matrix[start:start + size])]
+                start += size
+                pooled, column = [], 0
+                for width in opp_sizes:
+                    pooled.append(sum(row[column:column + width]) / width)
+                    column += width
+                rows.append(pooled)
+            return rows
+
+        return _Showdown(pool(self.blocked), pool(self.wins))
+
+
+class SubgameResolver:
+    def __init__(self, big_bet, time_budget=0.05, max_iterations=1000, min_iterations=20,
+                 max_raises=Poker.max_raises, max_combos=300, max_hero_combos=300, hero_buckets=12, opp_buckets=16,
+                 bucket_samples=3, leaf_samples=16, check_every=10, tolerance=0.003, seed=None):
+        """
+        Depth-limited heads-up re-solver for the late streets.
+
+        The betting on the current street is solved exactly. On seventh street
+        the leaves are showdowns; on sixth street the leaves are valued by the
+        showdown equity over sampled seventh street cards. Both ranges are grouped
+        by made hand strength into buckets of equal weight, and the solve plays
+        one strategy per bucket.
+
+        Parameters:
+        big_bet (int): The bet size on sixth and seventh street.
+        time_budget (float): Seconds available per decision, including setup.
+        max_iterations (int): Upper bound on CFR iterations.
+        min_iterations (int): Iterations required before the solution is trusted;
+                              if the budget expires first the blueprint is used.
+        max_raises (int): Bets and raises allowed on the street.
+        max_combos (int): Opponent hole card combos kept, highest belief first.
+        max_hero_combos (int): Combos sampled for the acting player's own range.
+        hero_buckets (int): Strength buckets of the acting player's range.
+        opp_buckets (int): Strength buckets of the opponent's range.
+        bucket_samples (int): Combos per bucket whose showdowns are evaluated.
+        leaf_samples (int): Sampled seventh street runouts on sixth street.
+        check_every (int): Iterations between exploitability checks.
+        tolerance (float): Stop once the average strategies are exploitable by less
+                           than this fraction of the pot.
+        seed (int): Seed for the range and runout sampling.
+        """
+        self.big_bet = big_bet
+        self.time_budget = time_budget
+        self.max_iterations = max_iterations
+        self.min_iterations = min_iterations
+        self.max_raises = max_raises
+        self.max_combos = max_combos
+        self.max_hero_combos = max_hero_combos
+        self.hero_buckets = hero_buckets
+        self.opp_buckets = opp_buckets
+        self.bucket_samples = bucket_samples
+        self.leaf_samples = leaf_samples
+        self.check_every = check_every
+        self.tolerance = tolerance
+        self.rng = random.Random(seed)
+        self.last_iterations = 0
+        self.last_exploitability = None
+
+    def resolve(self, state, player, beliefs=None, hero_reach=None):
+        """
+        Re-solve the current street for the acting player.
+
+        The position on the street (amount to call, bets made so far, whether the
+        opponent has checked) is read from state.street_actions(). The player is
+        solved over a range of hole cards, not just the cards actually held, so the
+        opponent cannot play a best response to a known hand: up to max_hero_combos
+        unseen combos are sampled and weighted by hero_reach. Each range is split
+        into strength buckets, which keeps the solution independent of which combos
+        were sampled, and the player acts from the bucket holding their cards.
+
+        state.pot must already hold every chip bet so far, including this street's
+        bets: payoffs treat it as sunk and count only the chips bet after this decision.
+        Record each bet with both state.add_action and state.update_pot.
+
+        Parameters:
+        state (GameState): The current game state.
+        player (Player): The acting player.
+        beliefs (dict): Opponent name -> {tuple of hole cards: weight}
+                        (defaults to a uniform range for the single opponent in the state).
+        hero_reach (callable): Maps a tuple of hole cards to the probability the blueprint
+                               would have played the hand this way (defaults to uniform).
+
+        Returns:
+        dict: action -> probability, or None to fall back to the blueprint.
+        """
+        deadline = time.perf_counter() + self.time_budget
+        self.last_iterations = 0
+        self.last_exploitability = None
+        if beliefs is None:
+            beliefs = {other.name: None for other in state.players if other is not player}
+        if state.current_round not in LATE_STREETS or len(beliefs) != 1:
+            return None
+        (opponent_name, opp_beliefs), = beliefs.items()
+
+        hero_up = [str(card) for card in state.get_visible_hand(player)]
+        opp_up = [str(card) for card in state.visible_cards[opponent_name]]
+        dead = set(hero_up + opp_up)
+        hole = _canonical(str(card) for card in player.hand if str(card) not in dead)
+        unseen = [card for card in CARDS if card not in dead]
+
+        # The opponent sees only upcards, so any unseen combo could be the player's
+        hero_combos = self._sample_combos(unseen, len(hole), self.max_hero_combos, include=hole)
+        hero_weights = [float(hero_reach(combo)) if hero_reach else 1.0 for combo in hero_combos]
+
+        if opp_beliefs is None:
+            live = [card for card in unseen if card not in hole]
+            opp_beliefs = dict.fromkeys(self._sample_combos(live, len(hole), self.max_combos), 1.0)
+        opp_beliefs = {_canonical(str(card) for card in combo): weight for combo, weight in opp_beliefs.items()}
+        opp_combos = sorted(
+            (combo for combo, weight in opp_beliefs.items() if weight > 0 and dead.isdisjoint(combo)),
+            key=opp_beliefs.get, reverse=True,
+        )[:self.max_combos]
+        if not opp_combos or sum(hero_weights) <= 0:
+            return None
+        opp_weights = [float(opp_beliefs[combo]) for combo in opp_combos]
+
+        hero_groups = self._bucket(hero_combos, hero_weights, hero_up, self.hero_buckets, include=hole)
+        opp_groups = self._bucket(opp_combos, opp_weights, opp_up, self.opp_buckets)
+        hero_index = next(i for i, (samples, _) in enumerate(hero_groups) if samples[0] == hole)
+        showdown = self._showdown_matrices(
+            state.current_round, [combo for samples, _ in hero_groups for combo in samples], hero_up,
+            [combo for samples, _ in opp_groups for combo in samples], opp_up, dead, deadline)
+        if showdown is None:
+            return None
+        showdown = showdown.pooled([len(samples) for samples, _ in hero_groups],
+                                   [len(samples) for samples, _ in opp_groups])
+        hero_weights = [weight for _, weight in hero_groups]
+        opp_weights = [weight for _, weight in opp_groups]
+
+        to_call, raises, checks = self._street_position(state, player)
+        root = self._build(HERO, to_call, raises, checks, 0, 0)
+        pot = state.pot
+        iteration_time = 0.0
+        for iteration in range(1, self.max_iterations + 1):
+            start = time.perf_counter()
+            if start + iteration_time > deadline:
+                break  # Another iteration would overrun the budget
+            showdown.clear()
+            self._cfr(root, hero_weights, opp_weights, pot, showdown, iteration)
+            iteration_time = time.perf_counter() - start
+            self.last_iterations = iteration
+
+            if iteration >= self.min_iterations and iteration % self.check_every == 0:
+                self.last_exploitability = self._exploitability(root, hero_weights, opp_weights, pot, showdown)
+                if self.last_exploitability <= self.tolerance * pot:
+                    break  # Neither player can gain much by deviating
+        if self.last_iterations < self.min_iterations:
+            return None
+
+        strategy = self._average([sums[hero_index] for sums in root.strategy_sum])
+        return dict(zip(root.actions, strategy))
+
+    def _sample_combos(self, cards, size, n, include=None):
+        """
+        Sample up to n distinct hole card combos from the given cards.
+
+        Parameters:
+        cards (list): The cards the combos are drawn from.
+        size (int): Cards per combo.
+        n (int): Maximum number of combos.
+        include (tuple): A combo drawn from the same cards that is always part of the result.
+
+        Returns:
+        list: Combos in canonical (sorted) order.
+        """
+        if math.comb(len(cards), size) <= n:
+            return [_canonical(combo) for combo in itertools.combinations(cards, size)]
+        combos = {include} if include is not None else set()
+        while len(combos) < n:
+            combos.add(_canonical(self.rng.sample(cards, size)))
+        return list(combos)
+
+    def _bucket(self, combos, weights, upcards, n_buckets, include=None):
+        """
+        Group a weighted range into buckets of about equal weight by made hand strength.
+
+        Combos of equal strength share a bucket. Each bucket keeps bucket_samples
+        combos spread over its strengths, whose showdowns stand in for the bucket.
+
+        Parameters:
+        combos (list): Hole card combos.
+        weights (list): Weight per combo.
+        upcards (list): The upcards the combos are evaluated with.
+        n_buckets (int): Maximum number of buckets.
+        include (tuple): A combo kept as the first sample of its bucket even at zero weight.
+
+        Returns:
+        list: (sampled combos, total weight) per bucket, weakest first.
+        """
+        kept = [(combo, weight) for combo, weight in zip(combos, weights) if weight > 0 or combo == include]
+        strengths = {combo: Game.hand_rank(list(combo) + upcards) for combo, _ in kept}
+        kept.sort(key=lambda item: (strengths[item[0]], item[0]))
+        total = sum(weight for _, weight in kept)
+
+        buckets = {}
+        seen = 0.0
+        for _, group in itertools.groupby(kept, key=lambda item: strengths[item[0]]):
+            group = list(group)
+            index = min(n_buckets - 1, int(n_buckets * seen / total)) if total > 0 else 0
+            buckets.setdefault(index, []).extend(group)
+            seen += sum(weight for _, weight in group)
+
+        groups = []
+        for members in buckets.values():
+            names = [combo for combo, _ in members]
+            n_samples = min(self.bucket_samples, len(names))
+            samples = [names[int((k + 0.5) * len(names) / n_samples)] for k in range(n_samples)]
+            if include in names:
+                samples = [include] + [combo for combo in samples if combo != include][:n_samples - 1]
+            groups.append((samples, sum(weight for _, weight in members)))
+        return groups
+
+    def _showdown_matrices(self, street, hero_combos, hero_up, opp_combos, opp_up, dead, deadline):
+        """
+        Build the blocker mask and showdown equity matrices (hero combos x opponent combos).
+
+        Returns:
+        _Showdown: The matrices, or None when the budget expires during setup.
+        """
+        if street == "seventh_street":
+            runouts = [((), ())]
+        else:
+            # Shared runouts keep the evaluations at (hero combos + opponent combos) x samples
+            live = [card for card in CARDS if card not in dead]
+            runouts = [tuple((card,) for card in self.rng.sample(live, 2)) for _ in range(self.leaf_samples)]
+
+        hero_ranks, opp_ranks = [], []
+        for combo in hero_combos:
+            hero_ranks.append([Game.hand_rank(list(combo) + hero_up + list(hero_card)) for hero_card, _ in runouts])
+            if time.perf_counter() > deadline:
+                return None
+        for combo in opp_combos:
+            opp_ranks.append([Game.hand_rank(list(combo) + opp_up + list(opp_card)) for _, opp_card in runouts])
+            if time.perf_counter() > deadline:
+                return None
+
+        hero_names = [{str(card) for card in combo} for combo in hero_combos]
+        opp_names = [{str(card) for card in combo} for combo in opp_combos]
+        runout_names = [{str(card) for cards in runout for card in cards} for runout in runouts]
+        blocked = [[0.0 if hero_cards & opp_cards else 1.0 for opp_cards in opp_names] for hero_cards in hero_names]
+
+        # Accumulate showdown results one runout at a time, skipping combos that hold a runout card
+        scores = [[0.0] * len(opp_combos) for _ in hero_combos]
+        counts = [[0] * len(opp_combos) for _ in hero_combos]
+        for r, names in enumerate(runout_names):
+            opp_column = [None if names & opp_cards else ranks[r] for opp_cards, ranks in zip(opp_names, opp_ranks)]
+            for h, hero_cards in enumerate(hero_names):
+                if names & hero_cards:
+                    continue
+                rank = hero_ranks[h][r]
+                scores[h] = [score if opp_rank is None else score + (rank > opp_rank) + 0.5 * (rank == opp_rank)
+                             for score, opp_rank in zip(scores[h], opp_column)]
+                counts[h] = [count + (opp_rank is not None) for count, opp_rank in zip(counts[h], opp_column)]
+
+        wins = [[b * score / count if count else 0.5 * b for b, score, count in zip(*rows)]
+                for rows in zip(blocked, scores, counts)]
+        return _Showdown(blocked, wins)
+
+    @staticmethod
+    def _street_position(state, player):
+        """
+        Read the acting player's position on the current street from the action history.
+
+        Returns:
+        tuple: (chips to call, bets and raises made, 1 if the opponent checked else 0).
+        """
+        actions = state.street_actions()
+        contributed = {}
+        raises = 0
+        for name, action, amount in actions:
+            contributed[name] = contributed.get(name, 0) + amount
+            raises += action in ("bet", "raise")
+        to_call = max(contributed.values(), default=0) - contributed.get(player.name, 0)
+        return to_call, raises, int(bool(actions) and raises == 0)
+
+    def _build(self, actor, to_call, raises, checks, hero_in, opp_in):
+        """
+        Recursively build the limit betting tree of the current street.
+
+        Parameters:
+        actor (int): HERO or OPP, the player to act.
+        to_call (int): Chips the actor must add to call (0 when not facing a bet).
+        raises (int): Bets and raises made on the street so far.
+        checks (int): 1 if the other player has checked, so a check closes the street.
+        hero_in (int): Chips the hero has added inside the subtree.
+        opp_in (int): Chips the opponent has added inside the subtree.
+        """
+        actions, children = [], []
+        if to_call:
+            actions.append("fold")
+            children.append(_Node(fold_by=actor, hero_in=hero_in, opp_in=opp_in))
+
+        # Calling (or checking behind) closes the street; an opening check passes the action
+        hero_call = hero_in + (to_call if actor == HERO else 0)
+        opp_call = opp_in + (to_call if actor == OPP else 0)
+        actions.append("call")
+        if to_call or checks:
+            children.append(_Node(hero_in=hero_call, opp_in=opp_call))
+        else:
+            children.append(self._build(1 - actor, 0, raises, 1, hero_call, opp_call))
+
+        if raises < self.max_raises:
+            raise_in = to_call + self.big_bet
+            actions.append("raise")
+            children.append(self._build(
+                1 - actor, self.big_bet, raises + 1, checks,
+                hero_in + (raise_in if actor == HERO else 0),
+                opp_in + (raise_in if actor == OPP else 0),
+            ))
+        return _Node(actor=actor, actions=tuple(actions), children=tuple(children))
+
+    def _cfr(self, node, hero_reach, opp_reach, pot, showdown, iteration):
+        """
+        One vectorized CFR+ pass over the subtree.
+
+        Returns:
+        tuple: (hero values per hero bucket, opponent values per opponent bucket).
+        """
+        if node.actor is None:
+            return self._terminal_values(node, hero_reach, opp_reach, pot, showdown)
+
+        actor_reach = hero_reach if node.actor == HERO else opp_reach
+        n_actions = len(node.actions)
+        if node.regrets is None:
+            node.regrets = [[0.0] * len(actor_reach) for _ in node.actions]
+            node.strategy_sum = [[0.0] * len(actor_reach) for _ in node.actions]
+        strategy = self._regret_matching(node.regrets)
+
+        hero_values = [0.0] * len(hero_reach)
+        opp_values = [0.0] * len(opp_reach)
+        action_values = []
+        for probs, child in zip(strategy, node.children):
+            child_reach = list(map(operator.mul, actor_reach, probs))
+            if node.actor == HERO:
+                child_hero, child_opp = self._cfr(child, child_reach, opp_reach, pot, showdown, iteration)
+                action_values.append(child_hero)
+                # Values of the player not acting here are summed over the actor's actions
+                opp_values = list(map(operator.add, opp_values, child_opp))
+            else:
+                child_hero, child_opp = self._cfr(child, hero_reach, child_reach, pot, showdown, iteration)
+                action_values.append(child_opp)
+                hero_values = list(map(operator.add, hero_values, child_hero))
+
+        actor_values = [0.0] * len(actor_reach)
+        for probs, values in zip(strategy, action_values):
+            actor_values = [u + p * v for u, p, v in zip(actor_values, probs, values)]
+        for a in range(n_actions):
+            # CFR+ floors the cumulative regrets at zero
+            node.regrets[a] = [r + v - u if r + v > u else 0.0
+                               for r, v, u in zip(node.regrets[a], action_values[a], actor_values)]
+            # Linear averaging weights later iterations more
+            node.strategy_sum[a] = [s + iteration * reach * p
+                                    for s, reach, p in zip(node.strategy_sum[a], actor_reach, strategy[a])]
+
+        if node.actor == HERO:
+            return actor_values, opp_values
+        return hero_values, actor_values
+
+    def _best_response(self, node, responder, hero_reach, opp_reach, pot, showdown):
+        """
+        Values of a best response by the responder to the other player's average strategy.
+
+        Returns:
+        list: The responder's counterfactual values, one per responder group.
+        """
+        if node.actor is None:
+            return self._terminal_values(node, hero_reach, opp_reach, pot, showdown)[responder]
+        if node.actor == responder:
+            child_values = [self._best_response(child, responder, hero_reach, opp_reach, pot, showdown)
+                            for child in node.children]
+            return [max(values) for values in zip(*child_values)]
+
+        actor_reach = hero_reach if node.actor == HERO else opp_reach
+        totals = [sum(column) for column in zip(*node.strategy_sum)]
+        values = None
+        for sums, child in zip(node.strategy_sum, node.children):
+            probs = [s / t if t > 0 else 1.0 / len(node.actions) for s, t in zip(sums, totals)]
+            child_reach = list(map(operator.mul, actor_reach, probs))
+            if node.actor == HERO:
+                child_values = self._best_response(child, responder, child_reach, opp_reach, pot, showdown)
+            else:
+                child_values = self._best_response(child, responder, hero_reach, child_reach, pot, showdown)
+            values = child_values if values is None else list(map(operator.add, values, child_values))
+        return values
+
+    def _exploitability(self, root, hero_weights, opp_weights, pot, showdown):
+        """
+        Chips per hand the two average strategies together lose to best responses (0 at equilibrium).
+        """
+        showdown.clear()
+        hero_best = self._best_response(root, HERO, hero_weights, opp_weights, pot, showdown)
+        opp_best = self._best_response(root, OPP, hero_weights, opp_weights, pot, showdown)
+        pairs = sum(map(operator.mul, hero_weights, showdown.against_opponent(opp_weights)))
+        gain = sum(map(operator.mul, hero_weights, hero_best)) + sum(map(operator.mul, opp_weights, opp_best))
+        return gain / pairs if pairs > 0 else 0.0
+
+    @staticmethod
+    def _terminal_values(node, hero_reach, opp_reach, pot, showdown):
+        """
+        Counterfactual values at a fold or showdown, in hero chips won (opponent values are negated).
+
+        pot holds every chip bet before the subtree, this street's bets included, and
+        is sunk; hero_in and opp_in are the chips each side adds inside the subtree.
+        """
+        total = pot + node.hero_in + node.opp_in
+        opp_blocked = showdown.against_opponent(opp_reach)
+        hero_blocked = showdown.against_hero(hero_reach)
+        if node.fold_by is None:
+            # Hero wins total * equity and has paid hero_in
+            opp_wins = showdown.against_opponent(opp_reach, "wins")
+            hero_wins = showdown.against_hero(hero_reach, "wins")
+            hero_values = [total * w - node.hero_in * b for w, b in zip(opp_wins, opp_blocked)]
+            opp_values = [node.hero_in * b - total * w for w, b in zip(hero_wins, hero_blocked)]
+            return hero_values, opp_values
+
+        payoff = -node.hero_in if node.fold_by == HERO else pot + node.opp_in
+        return [payoff * b for b in opp_blocked], [-payoff * b for b in hero_blocked]
+
+    @staticmethod
+    def _regret_matching(regrets):
+        """
+        Current strategy from per-action regret columns, uniform where no regret is positive.
+        """
+        n_actions = len(regrets)
+        totals = [sum(column) for column in zip(*regrets)]
+        return [[r / t if t > 0 else 1.0 / n_actions for r, t in zip(column, totals)] for column in regrets]
+
+    @staticmethod
+    def _average(weights):
+        """
+        Normalize non-negative weights to a distribution, uniform if they are all zero.
+        """
+        total = sum(weights)
+        if total <= 0:
+            return [1.0 / len(weights)] * len(weights)
+        return [w / total for w in weights]
+
+
+class ResolvingPlayer(Player):
+    def __init__(self, name, chips, model, resolver, device="cpu"):
+        """
+        Initialize a Player that re-solves sixth and seventh street and uses the
+        blueprint model everywhere else. Game.betting_round passes the GameState
+        the re-solve reads.
+
+        Parameters:
+        name (str): The player's name.
+        chips (int): The player's starting chip stack.
+        model (DeepCFRModel): The blueprint model.
+        resolver (SubgameResolver): The late street re-solver.
+        device (str): The device for model computations (e.g., 'cpu' or 'cuda').
+        """
+        super().__init__(name, chips, model, device)
+        self.resolver = resolver
+
+    def take_action(self, current_bet, pot, visible_cards, legal_actions, state=None, beliefs=None):
+        """
+        Determine the player's action, re-solving the subgame when possible.
+
+        Parameters:
+        current_bet (int): The current bet size in the round.
+        pot (int): The total chips in the pot.
+        visible_cards (list): The visible cards on the table.
+        legal_actions (list): Legal actions available to the player (e.g., ["fold", "call", "raise"]).
+        state (GameState): The current game state; without it the blueprint is used.
+        beliefs (dict): Opponent name -> {tuple of hole cards: weight} (defaults to uniform).
+
+        Returns:
+        str: The chosen action.
+        """
+        strategy = None
+        if state is not None:
+            strategy = self.resolver.resolve(state, self, beliefs)
+        weights = [strategy.get(action, 0.0) for action in legal_actions] if strategy else []
+        if sum(weights) <= 0:
+            return super().take_action(current_bet, pot, visible_cards, legal_actions)
+
+        action = random.choices(legal_actions, weights=weights)[0]
+        self.action_history.append(action)
+        return action
+
+
+def benchmark(resolver, decisions=200, opponent_combos=100, seed=0):
+    """
+    Time re-solves on random heads-up sixth and seventh street spots.
+
+    Parameters:
+    resolver (SubgameResolver): The resolver under test.
+    decisions (int): Number of decisions to time.
+    opponent_combos (int): Size of the sampled opponent belief per decision.
+    seed (int): Seed for the spots.
+
+    Returns:
+    dict: Latency percentiles in milliseconds, mean CFR iterations, mean exploitability
+          (fraction of the pot, at the last check) and the blueprint fallback rate.
+    """
+    rng = random.Random(seed)
+    Game.hand_rank(CARDS[:5])  # Load eval7 before timing
+    latencies, iterations, exploitability, fallbacks = [], [], [], 0
+    for i in range(decisions):
+        street = LATE_STREETS[i % 2]
+        n_cards = 6 if street == "sixth_street" else 7
+        cards = list(CARDS)
+        rng.shuffle(cards)
+        hero, opponent = Player("Hero", 1000, model=None), Player("Villain", 1000, model=None)
+        hero.hand = cards[:n_cards]
+        state = GameState([hero, opponent], pot=rng.randrange(4, 20) * resolver.big_bet, current_round=street)
+        for card in hero.hand[2:6]:
+            state.update_visible_cards(hero, card)
+        for card in cards[n_cards:n_cards + 4]:
+            state.update_visible_cards(opponent, card)
+
+        live = cards[n_cards + 4:]
+        combos = list(itertools.combinations(live, n_cards - 4))
+        belief = {combo: 1.0 for combo in rng.sample(combos, min(opponent_combos, len(combos)))}
+        # The opponent opened the street with a bet, checked, or has not acted yet
+        opening = rng.randrange(3)
+        if opening == 0:
+            state.add_action(opponent, "raise", resolver.big_bet)
+            state.update_pot(resolver.big_bet)
+        elif opening == 1:
+            state.add_action(opponent, "check")
+
+        start = time.perf_counter()
+        strategy = resolver.resolve(state, hero, {opponent.name: belief})
+        latencies.append((time.perf_counter() - start) * 1000)
+        iterations.append(resolver.last_iterations)
+        if resolver.last_exploitability is not None:
+            exploitability.append(resolver.last_exploitability / state.pot)
+        fallbacks += strategy is None
+
+    latencies.sort()
+    percentile = lambda q: latencies[min(len(latencies) - 1, int(q * len(latencies)))]
+    return {
+        "p50": percentile(0.50),
+        "p90": percentile(0.90),
+        "p99": percentile(0.99),
+        "max": latencies[-1],
+        "mean_iterations": sum(iterations) / decisions,
+        "mean_exploitability": sum(exploitability) / len(exploitability) if exploitability else None,
+        "fallback_rate": fallbacks / decisions,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog="python -m Game.resolver",
+        description="Benchmark late street re-solving latency.",
+    )
+    parser.add_argument("--decisions", type=int, default=200)
+    parser.add_argument("--combos", type=int, default=100, help="Opponent belief size per decision.")
+    parser.add_argument("--budget-ms", type=float, default=50.0)
+    parser.add_argument("--big-bet", type=int, default=20)
+    args = parser.parse_args()
+
+    resolver = SubgameResolver(args.big_bet, time_budget=args.budget_ms / 1000, seed=0)
+    results = benchmark(resolver, args.decisions, args.combos)
+    for name in ("p50", "p90", "p99", "max"):
+        print(f"{name:<6} {results[name]:8.2f} ms")
+    print(f"Mean CFR iterations: {results['mean_iterations']:.1f}")
+    if results["mean_exploitability"] is not None:
+        print(f"Mean exploitability: {results['mean_exploitability']:.2%} of the pot")
+    print(f"Blueprint fallback rate: {results['fallback_rate']:.1%}")
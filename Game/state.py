@@ -1,4 +1,5 @@
-import eval7
+from Game.deck import card_index, hand_rank
+
 
 class GameState:
     def __init__(self, players, pot=0, current_round="third_street"):
@@ -14,6 +15,7 @@ class GameState:
         self.pot = pot
         self.current_round = current_round
         self.action_history = []  # List of tuples (player, action, amount)
+        self.street_start = 0  # Index in action_history where the current round begins
         self.visible_cards = {player.name: [] for player in players}  # Visible cards per player
 
     def reset(self):
@@ -23,11 +25,13 @@ class GameState:
         self.pot = 0
         self.current_round = "third_street"
         self.action_history = []
+        self.street_start = 0
         self.visible_cards = {player.name: [] for player in self.players}
 
     def update_pot(self, amount):
         """
-        Add an amount to the pot.
+        Add an amount to the pot. Call it for every bet recorded with add_action,
+        so the pot always includes the current street's bets.
 
         Parameters:
         amount (int): The amount to add to the pot.
@@ -41,17 +45,26 @@ class GameState:
         Parameters:
         player (Player): The player performing the action.
         action (str): The action taken (e.g., "fold", "call", "raise").
-        amount (int): The amount involved in the action (default is 0).
+        amount (int): The chips the action put into the pot (default is 0).
         """
         self.action_history.append((player.name, action, amount))
 
+    def street_actions(self):
+        """
+        Get the actions taken in the current betting round.
+
+        Returns:
+        list: Tuples (player, action, amount) since the round began.
+        """
+        return self.action_history[self.street_start:]
+
     def update_visible_cards(self, player, card):
         """
         Add a card to a player's visible cards.
 
         Parameters:
         player (Player): The player receiving the card.
-        card (eval7.Card): The card to add to the visible cards.
+        card (str): The card to add to the visible cards (e.g. "As").
         """
         self.visible_cards[player.name].append(card)
 
@@ -63,7 +76,7 @@ class GameState:
         player (Player): The player whose visible hand is requested.
 
         Returns:
-        list: A list of eval7.Card objects representing the player's visible hand.
+        list: The cards in the player's visible hand.
         """
         return self.visible_cards[player.name]
 
@@ -80,7 +93,7 @@ class GameState:
         visible_hand = self.get_visible_hand(player)
         if len(visible_hand) < 2:
             return 0  # Not enough cards to evaluate
-        return eval7.HandEvaluator.evaluate(visible_hand)
+        return hand_rank(visible_hand)
 
     def determine_next_actor(self):
         """
@@ -109,7 +122,7 @@ class GameState:
         encoded_state = {
             "pot": self.pot,
             "current_round": self.current_round,
-            "visible_cards": {player: [card.index for card in cards] for player, cards in self.visible_cards.items()},
+            "visible_cards": {player: [card_index(card) for card in cards] for player, cards in self.visible_cards.items()},
             "action_history": self.action_history,
         }
         return encoded_state
@@ -121,4 +134,5 @@ class GameState:
         rounds = ["third_street", "fourth_street", "fifth_street", "sixth_street", "seventh_street"]
         current_index = rounds.index(self.current_round)
         if current_index + 1 < len(rounds):
-            self.current_round = rounds[current_index + 1]
\ No newline at end of file
+            self.current_round = rounds[current_index + 1]
+            self.street_start = len(self.action_history)
\ No newline at end of file
@@ -0,0 +1,401 @@
+import bisect
+import hashlib
+import itertools
+import mmap
+import random
+import struct
+import sys
+
+from Game.deck import CARDS, RANKS, card_index
+from Game.player import Player
+from Game.poker import Poker
+
+# File layout (little endian):
+#   header   magic, version, number of actions, number of entries, length of action names
+#   names    comma separated action names, padded to an 8 byte boundary
+#   ids      sorted uint64 info set ids, one per entry
+#   probs    uint8 quantized action probabilities, n_actions per entry
+MAGIC = b"SHLT"
+VERSION = 1
+HEADER = struct.Struct("<4sHHII")
+QUANT_SCALE = 255
+
+# Street is implied by the number of cards a player holds
+STREETS = {n_cards: street for street, n_cards in Poker.betting_rounds.items()}
+
+# Abstraction buckets. Every combination of them is one abstracted info set.
+LOW_RANKS = set("A2345678")
+PATTERNS = ("high_card", "pair", "two_pair", "trips", "full_house", "quads")
+MAX_LOW_CARDS = 5
+BET_BUCKETS = 5
+# Cards needed before a pattern can appear
+PATTERN_CARDS = {"high_card": 1, "pair": 2, "two_pair": 4, "trips": 3, "full_house": 5, "quads": 4}
+# Upcards are the third to sixth cards dealt; at most four are ever showing
+MAX_UPCARDS = 4
+# Opponents' boards are bucketed coarsely by the rank of their largest group
+RANK_BUCKETS = {rank: bucket for bucket, ranks in (("low", "234567"), ("mid", "89T"), ("high", "JQ"), ("top", "KA"))
+                for rank in ranks}
+NO_UPCARDS = ("none", "none")
+
+
+def _format_key(street, pattern, top_rank, low_cards, up_pattern, opp_pattern, opp_rank, bet_bucket):
+    return f"{street}:{pattern}:{top_rank}:{low_cards}:{up_pattern}:{opp_pattern}:{opp_rank}:{bet_bucket}"
+
+
+def _pattern(cards):
+    """
+    Reduce cards to their pairing pattern and the rank index of the largest group.
+
+    Parameters:
+    cards (list): Cards as eval7.Card objects or strings like "As".
+
+    Returns:
+    tuple: (pattern, rank index), best groups first so tuples compare by strength.
+    """
+    counts = {}
+    for card in cards:
+        rank = str(card)[0]
+        counts[rank] = counts.get(rank, 0) + 1
+    groups = sorted(((n, RANKS.index(rank)) for rank, n in counts.items()), reverse=True)
+    sizes = [n for n, _ in groups]
+    if sizes[0] >= 4:
+        pattern = "quads"
+    elif sizes[0] == 3:
+        pattern = "full_house" if len(sizes) > 1 and sizes[1] >= 2 else "trips"
+    elif sizes[0] == 2:
+        pattern = "two_pair" if len(sizes) > 1 and sizes[1] == 2 else "pair"
+    else:
+        pattern = "high_card"
+    return pattern, groups[0][1]
+
+
+def info_set_key(hand, opponent_upcards, current_bet, pot):
+    """
+    Map a decision to its abstracted information set key.
+
+    The player's cards are reduced to their pairing pattern, the rank of the
+    largest group, and the number of distinct low cards (for the low half of
+    the pot). The player's own upcards and the strongest opponent board are
+    reduced to their pairing patterns, so the key tells a hidden hand from
+    one showing. The bet is bucketed relative to the pot.
+
+    Parameters:
+    hand (list): The player's cards in the order dealt (eval7.Card objects or strings like "As").
+                 The third to sixth cards are the upcards.
+    opponent_upcards (list): One list of visible cards per opponent still in the hand.
+    current_bet (int): The current bet size in the round.
+    pot (int): The total chips in the pot.
+
+    Returns:
+    str: The information set key.
+    """
+    street = STREETS.get(len(hand))
+    if street is None:
+        raise ValueError(f"A stud hand holds 3 to 7 cards, got {len(hand)}.")
+    pattern, top_rank = _pattern(hand)
+    up_pattern, _ = _pattern(hand[2:2 + MAX_UPCARDS])
+    low_cards = min(MAX_LOW_CARDS, len(LOW_RANKS.intersection(str(card)[0] for card in hand)))
+    boards = [_pattern(cards) for cards in opponent_upcards if cards]
+    if boards:
+        opp_pattern, opp_rank = max(boards, key=lambda board: (PATTERNS.index(board[0]), board[1]))
+        opp_rank = RANK_BUCKETS[RANKS[opp_rank]]
+    else:
+        opp_pattern, opp_rank = NO_UPCARDS
+    bet_bucket = min(BET_BUCKETS - 1, (4 * current_bet) // pot) if pot > 0 else 0
+    return _format_key(street, pattern, RANKS[top_rank], low_cards, up_pattern, opp_pattern, opp_rank, bet_bucket)
+
+
+def abstract_info_sets():
+    """
+    Enumerate every abstracted information set key.
+
+    Combinations that need more cards than the street deals are left out.
+
+    Returns:
+    generator: Keys in the format produced by info_set_key.
+    """
+    boards = [NO_UPCARDS] + list(itertools.product(PATTERNS, dict.fromkeys(RANK_BUCKETS.values())))
+    for n_cards, street in STREETS.items():
+        n_up = min(n_cards - 2, MAX_UPCARDS)
+        for pattern, top_rank, low_cards, up_pattern, (opp_pattern, opp_rank), bet_bucket in itertools.product(
+                PATTERNS, RANKS, range(MAX_LOW_CARDS + 1), PATTERNS, boards, range(BET_BUCKETS)):
+            if (PATTERN_CARDS[pattern] > n_cards or low_cards > n_cards
+                    or PATTERN_CARDS[up_pattern] > n_up or PATTERN_CARDS.get(opp_pattern, 0) > n_up):
+                continue
+            yield _format_key(street, pattern, top_rank, low_cards, up_pattern, opp_pattern, opp_rank, bet_bucket)
+
+
+def info_set_id(info_set):
+    """
+    Map an information set to its stable 64-bit table id.
+
+    Parameters:
+    info_set (hashable): The information set, as used as a key in the CFR strategies.
+
+    Returns:
+    int: The info set id.
+    """
+    digest = hashlib.blake2b(str(info_set).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def quantize(probabilities):
+    """
+    Quantize a probability vector to bytes, keeping the rounded values summing to QUANT_SCALE.
+
+    Parameters:
+    probabilities (list): Non-negative action probabilities.
+
+    Returns:
+    bytes: One byte per action.
+    """
+    total = sum(probabilities)
+    if total <= 0:
+        probabilities = [1.0] * len(probabilities)
+        total = float(len(probabilities))
+    scaled = [p * QUANT_SCALE / total for p in probabilities]
+    quantized = [int(s) for s in scaled]
+    # Hand the rounding remainder to the largest fractional parts
+    remainder = QUANT_SCALE - sum(quantized)
+    order = sorted(range(len(scaled)), key=lambda i: quantized[i] - scaled[i])
+    for i in order[:remainder]:
+        quantized[i] += 1
+    return bytes(quantized)
+
+
+def export_strategy_table(path, policy, actions=("fold", "call", "raise"), info_sets=None):
+    """
+    Evaluate a policy over every abstracted information set and write the quantized strategy table.
+
+    Parameters:
+    path (str): Output file path.
+    policy (callable): Maps an info set key to a dict of action -> probability,
+                       or None to leave the info set out of the table.
+    actions (tuple): Action order of the table columns.
+    info_sets (iterable): Info set keys to evaluate (defaults to abstract_info_sets()).
+
+    Returns:
+    int: The number of exported information sets.
+    """
+    rows = {}
+    for info_set in abstract_info_sets() if info_sets is None else info_sets:
+        strategy = policy(info_set)
+        if strategy is None:
+            continue
+        row_id = info_set_id(info_set)
+        if row_id in rows:
+            raise ValueError(f"Info set id collision for {info_set!r}.")
+        rows[row_id] = quantize([float(strategy.get(action, 0.0)) for action in actions])
+
+    names = ",".join(actions).encode()
+    names += b"\0" * (-(HEADER.size + len(names)) % 8)
+    ids = sorted(rows)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(actions), len(ids), len(names)))
+        f.write(names)
+        f.write(struct.pack(f"<{len(ids)}Q", *ids))
+        f.write(b"".join(rows[row_id] for row_id in ids))
+    return len(ids)
+
+
+def aggregate_policy(strategies, decision):
+    """
+    Build an export policy from strategies keyed by native information sets, such as CFR's nash_equilibrium.
+
+    Each native info set is mapped to its abstracted key and the strategies sharing a key are averaged.
+
+    Parameters:
+    strategies (dict): Native info set -> dict of action -> probability.
+    decision (callable): Maps a native info set to the (hand, opponent_upcards, current_bet, pot)
+                         arguments of info_set_key.
+
+    Returns:
+    callable: Maps an info set key to its averaged strategy, or None if no native info set abstracts to it.
+    """
+    totals = {}
+    counts = {}
+    for info_set, strategy in strategies.items():
+        key = info_set_key(*decision(info_set))
+        total = totals.setdefault(key, {})
+        for action, probability in strategy.items():
+            total[action] = total.get(action, 0.0) + probability
+        counts[key] = counts.get(key, 0) + 1
+    averaged = {key: {action: p / counts[key] for action, p in total.items()} for key, total in totals.items()}
+    return averaged.get
+
+
+def model_policy(model, actions=("fold", "call", "raise"), deals=200000, batch_size=1024,
+                 pots=range(10, 410, 10), bets=(0, 10, 20, 40), chips=1000, seed=None, device="cpu"):
+    """
+    Build an export policy by querying a DeepCFRModel on sampled heads-up decisions.
+
+    Random deals on every street are run through the model in batches, encoded
+    as the player's cards, the opponent's upcards and (current bet, pot, chips).
+    The action probabilities are averaged per info set key by aggregate_policy;
+    keys that no deal reaches are left out of the table.
+
+    Parameters:
+    model (DeepCFRModel): Model with two card groups, three bet features and one output per action.
+    actions (tuple): The model's action order.
+    deals (int): Number of sampled decisions.
+    batch_size (int): Decisions per forward pass.
+    pots (sequence): Pot sizes to sample from.
+    bets (sequence): Current bet sizes to sample from.
+    chips (int): The player's chip stack in every decision.
+    seed (int): Seed for the deal sampler (optional).
+    device (str): The device for model computations.
+
+    Returns:
+    callable: Maps an info set key to the model's averaged strategy, or None.
+    """
+    import torch  # Only exporting from a model needs torch
+
+    rng = random.Random(seed)
+    streets = list(STREETS)
+    decisions = []
+    strategies = []
+    for start in range(0, deals, batch_size):
+        batch = []
+        for _ in range(min(batch_size, deals - start)):
+            n_cards = rng.choice(streets)
+            cards = rng.sample(CARDS, 2 * n_cards)
+            hand, opponent = cards[:n_cards], cards[n_cards:]
+            batch.append((hand, [opponent[2:2 + MAX_UPCARDS]], rng.choice(bets), rng.choice(pots)))
+
+        hands = [[card_index(card) for card in hand] + [-1] * (7 - len(hand)) for hand, _, _, _ in batch]
+        boards = [[card_index(card) for card in upcards[0]] + [-1] * (MAX_UPCARDS - len(upcards[0]))
+                  for _, upcards, _, _ in batch]
+        with torch.no_grad():
+            logits = model(
+                [torch.tensor(hands, dtype=torch.long, device=device),
+                 torch.tensor(boards, dtype=torch.long, device=device)],
+                torch.tensor([[current_bet, pot, chips] for _, _, current_bet, pot in batch],
+                             dtype=torch.float32, device=device),
+            )
+        for probabilities in torch.softmax(logits, dim=-1).tolist():
+            strategies.append(dict(zip(actions, probabilities)))
+        decisions.extend(batch)
+    return aggregate_policy(dict(enumerate(strategies)), decisions.__getitem__)
+
+
+class _LittleEndianIds:
+    def __init__(self, buffer):
+        """
+        Read-only sequence of little endian uint64 values, for hosts that cannot cast the buffer in place.
+
+        Parameters:
+        buffer (memoryview): The packed ids.
+        """
+        self._buffer = buffer
+
+    def __len__(self):
+        return len(self._buffer) // 8
+
+    def __getitem__(self, i):
+        return struct.unpack_from("<Q", self._buffer, 8 * i)[0]
+
+    def release(self):
+        self._buffer.release()
+
+
+class StrategyTable:
+    def __init__(self, path):
+        """
+        Memory-map an exported strategy table.
+
+        Parameters:
+        path (str): Path of a file written by export_strategy_table.
+        """
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, n_actions, n_entries, names_len = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a version {VERSION} strategy table.")
+        names_start = HEADER.size
+        ids_start = names_start + names_len
+        probs_start = ids_start + 8 * n_entries
+        self.actions = bytes(self._mmap[names_start:ids_start]).rstrip(b"\0").decode().split(",")
+        self.n_actions = n_actions
+        ids = memoryview(self._mmap)[ids_start:probs_start]
+        # The ids are stored little endian; only a little endian host can view them in place
+        self._ids = ids.cast("Q") if sys.byteorder == "little" else _LittleEndianIds(ids)
+        self._probs_start = probs_start
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """
+        Release the memory map.
+        """
+        self._ids.release()
+        self._mmap.close()
+
+    def lookup(self, info_set):
+        """
+        Look up the strategy for an information set.
+
+        Parameters:
+        info_set (hashable): The information set.
+
+        Returns:
+        dict: action -> probability, or None if the info set is not in the table.
+        """
+        row_id = info_set_id(info_set)
+        i = bisect.bisect_left(self._ids, row_id)
+        if i == len(self._ids) or self._ids[i] != row_id:
+            return None
+        start = self._probs_start + i * self.n_actions
+        row = self._mmap[start:start + self.n_actions]
+        return {action: q / QUANT_SCALE for action, q in zip(self.actions, row)}
+
+
+class TablePlayer(Player):
+    def __init__(self, name, chips, table):
+        """
+        Initialize a Player that acts from a precomputed strategy table.
+
+        Parameters:
+        name (str): The player's name.
+        chips (int): The player's starting chip stack.
+        table (StrategyTable): The exported strategy table.
+        """
+        super().__init__(name, chips, model=None)
+        self.table = table
+
+    def take_action(self, current_bet, pot, visible_cards, legal_actions, state=None):
+        """
+        Determine the player's action by table lookup.
+
+        Parameters:
+        current_bet (int): The current bet size in the round.
+        pot (int): The total chips in the pot.
+        visible_cards (list): The visible cards on the table, taken as one opponent's upcards
+                              when no state is given.
+        legal_actions (list): Legal actions available to the player (e.g., ["fold", "call", "raise"]).
+        state (GameState): The hand's state; gives each opponent's upcards separately (optional).
+
+        Returns:
+        str: The chosen action.
+        """
+        if state is not None:
+            opponent_upcards = [
+                state.get_visible_hand(player) for player in state.players if player.name != self.name
+            ]
+        else:
+            opponent_upcards = [visible_cards]
+        strategy = self.table.lookup(info_set_key(self.hand, opponent_upcards, current_bet, pot))
+        weights = [strategy.get(action, 0.0) for action in legal_actions] if strategy else []
+        if sum(weights) <= 0:
+            weights = [1.0] * len(legal_actions)  # Unseen info set: play uniformly
+
+        action = random.choices(legal_actions, weights=weights)[0]
+        self.action_history.append(action)
+        return action
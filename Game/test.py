@@ -1,8 +1,6 @@
 import logging
-from Game import game
-from deck import Deck
-from player import Player
-from logging import GameLogger
+from Game.game import Game
+from Game.logger import GameLogger
 
 # Mock Player class for testing
 class MockPlayer:
@@ -12,7 +10,7 @@ class MockPlayer:
         self.hand = []
         self.current_bet = 0
 
-    def take_action(self, current_bet, bet_limit):
+    def take_action(self, current_bet, pot, visible_cards, legal_actions, state=None):
         """
         Simulate player actions for testing.
         Players will call if they can afford it, or fold if not.
@@ -0,0 +1,31 @@
+import logging
+
+from Game.deck import CARDS, Deck, card_index, hand_rank
+from Game.game import Game
+
+
+def test_deal_returns_plain_cards():
+    deck = Deck()
+    hand = deck.deal(7)
+    assert len(set(hand)) == 7
+    assert all(card in CARDS for card in hand)
+    assert deck.remaining_cards() == 45
+
+
+def test_card_index_matches_deck_order():
+    assert [card_index(card) for card in CARDS] == list(range(52))
+
+
+def test_hand_rank_orders_hands():
+    assert hand_rank("As Ad Ac Kd Ks 2c 3h".split()) > hand_rank("As Ad Kc Kd Qs 2c 3h".split())
+    assert Game.hand_rank("2c 3d 4h 5s 6c Kd Kh".split()) == hand_rank("2c 3d 4h 5s 6c Kd Kh".split())
+
+
+def test_bring_in_is_lowest_upcard():
+    class Seat:
+        def __init__(self, name, hand):
+            self.name, self.hand = name, hand
+
+    players = [Seat("A", ["Ac", "Kd", "2s"]), Seat("B", ["3c", "4d", "2c"]), Seat("C", ["5c", "6d", "Th"])]
+    game = Game(players, ante=1, small_bet=2, big_bet=4, logger=logging.getLogger(__name__))
+    assert game.determine_bring_in().name == "B"
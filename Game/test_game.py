@@ -0,0 +1,85 @@
+import logging
+
+from Game.game import Game
+from Game.player import Player
+from Game.resolver import ResolvingPlayer, SubgameResolver
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ScriptedPlayer:
+    # Plays the given actions in turn, then calls; keeps what it was shown
+    def __init__(self, name, chips, actions=()):
+        self.name = name
+        self.chips = chips
+        self.hand = []
+        self.current_bet = 0
+        self.actions = list(actions)
+        self.seen = []
+
+    def take_action(self, current_bet, pot, visible_cards, legal_actions, state=None):
+        self.seen.append((state.current_round, pot, state.pot, list(state.street_actions()), legal_actions))
+        return self.actions.pop(0) if self.actions else "call"
+
+
+def test_betting_round_keeps_state():
+    alice, bob = ScriptedPlayer("Alice", 100, ["raise", "raise"]), ScriptedPlayer("Bob", 100, ["raise"])
+    game = Game([alice, bob], ante=5, small_bet=10, big_bet=20, logger=LOGGER)
+    game.ante_up()
+    for _ in range(3):
+        game.deal_card()
+    game.betting_round(10)
+
+    assert game.state.street_actions() == [
+        ("Alice", "raise", 10), ("Bob", "raise", 20), ("Alice", "raise", 20), ("Bob", "call", 10)]
+    assert game.pot == game.state.pot == 10 + 60
+    assert alice.chips == bob.chips == 100 - 5 - 30
+    # The pot passed to each player matches the state, and the raise cap is enforced
+    assert all(pot == state_pot for _, pot, state_pot, _, _ in alice.seen + bob.seen)
+    assert bob.seen[-1][4] == ["fold", "call"]
+    assert game.state.get_visible_hand(alice) == alice.hand[2:3]
+
+
+def test_play_hand_tracks_streets():
+    alice, bob = ScriptedPlayer("Alice", 100), ScriptedPlayer("Bob", 100)
+    game = Game([alice, bob], ante=5, small_bet=10, big_bet=20, logger=LOGGER)
+    game.play_hand()
+
+    assert [seen[0] for seen in alice.seen] == [
+        "third_street", "fourth_street", "fifth_street", "sixth_street", "seventh_street"]
+    assert game.state.current_round == "seventh_street"
+    assert game.state.get_visible_hand(bob) == bob.hand[2:6]
+    assert alice.chips + bob.chips == 200
+
+
+def test_fold_ends_the_hand():
+    alice, bob = ScriptedPlayer("Alice", 100, ["raise"]), ScriptedPlayer("Bob", 100, ["fold"])
+    game = Game([alice, bob], ante=5, small_bet=10, big_bet=20, logger=LOGGER)
+    game.play_hand()
+
+    assert game.active_players == [alice] and game.state.players == [alice]
+    assert len(alice.hand) == 3
+    assert (alice.chips, bob.chips) == (105, 95)
+
+
+def test_resolving_player_resolves_in_game(monkeypatch):
+    # The blueprint checks or calls on the early streets
+    monkeypatch.setattr(Player, "take_action", lambda self, *args, **kwargs: "call")
+    resolver = SubgameResolver(20, time_budget=0.5, seed=0)
+    resolved = []
+    resolve = resolver.resolve
+
+    def recording_resolve(state, player, beliefs=None):
+        strategy = resolve(state, player, beliefs)
+        resolved.append((state.current_round, strategy))
+        return strategy
+
+    monkeypatch.setattr(resolver, "resolve", recording_resolve)
+
+    hero, villain = ResolvingPlayer("Hero", 1000, None, resolver), ScriptedPlayer("Villain", 1000)
+    game = Game([hero, villain], ante=5, small_bet=10, big_bet=20, logger=LOGGER)
+    game.play_hand()
+
+    late = [(street, strategy) for street, strategy in resolved if street in ("sixth_street", "seventh_street")]
+    assert {street for street, _ in late} == {"sixth_street", "seventh_street"}
+    assert all(strategy is not None for _, strategy in late)
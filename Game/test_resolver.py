@@ -0,0 +1,204 @@
+import pytest
+
+from Game.deck import CARDS
+from Game.player import Player
+from Game.resolver import HERO, OPP, ResolvingPlayer, SubgameResolver, _Node, _Showdown
+from Game.state import GameState
+
+BIG_BET = 20
+
+
+def cards(names):
+    return names.split()
+
+
+def make_state(hero_hole, hero_up, opp_up, street="seventh_street", pot=100):
+    hero, opponent = Player("Hero", 1000, model=None), Player("Villain", 1000, model=None)
+    hero.hand = cards(hero_hole) + cards(hero_up)
+    state = GameState([hero, opponent], pot=pot)
+    while state.current_round != street:
+        state.next_round()
+    for card in cards(hero_up):
+        state.update_visible_cards(hero, card)
+    for card in cards(opp_up):
+        state.update_visible_cards(opponent, card)
+    return state, hero, opponent
+
+
+def raise_depth(node):
+    depth = 0
+    while "raise" in node.actions:
+        node = node.children[node.actions.index("raise")]
+        depth += 1
+    return depth
+
+
+def test_build_first_to_act():
+    resolver = SubgameResolver(BIG_BET)
+    root = resolver._build(HERO, 0, 0, 0, 0, 0)
+    assert root.actor == HERO
+    assert root.actions == ("call", "raise")
+
+    # An opening check passes the action; checking behind ends the street
+    check = root.children[0]
+    assert check.actor == OPP and check.actions == ("call", "raise")
+    assert check.children[0].actor is None and check.children[0].fold_by is None
+    assert raise_depth(root) == resolver.max_raises
+
+
+def test_build_facing_bet():
+    resolver = SubgameResolver(BIG_BET)
+    root = resolver._build(HERO, 10, 1, 0, 0, 0)
+    assert root.actions == ("fold", "call", "raise")
+    fold, call, raise_ = root.children
+    assert fold.fold_by == HERO and fold.hero_in == 0
+    assert call.actor is None and call.hero_in == 10
+    assert raise_.actor == OPP and raise_.actions == ("fold", "call", "raise")
+    assert raise_.children[1].hero_in == 10 + BIG_BET
+    assert raise_.children[1].opp_in == BIG_BET
+    assert raise_depth(root) == resolver.max_raises - 1
+
+
+def test_build_raise_cap():
+    resolver = SubgameResolver(BIG_BET, max_raises=3)
+    assert resolver._build(HERO, BIG_BET, 3, 0, 0, 0).actions == ("fold", "call")
+
+
+def test_street_position():
+    state, hero, opponent = make_state("2c 3d", "5s 7c 9d Jh", "Ac Ad Ah As", street="sixth_street")
+    resolver = SubgameResolver(BIG_BET)
+    assert resolver._street_position(state, hero) == (0, 0, 0)
+
+    state.add_action(opponent, "check")
+    assert resolver._street_position(state, hero) == (0, 0, 1)
+
+    state.add_action(hero, "raise", BIG_BET)
+    state.add_action(opponent, "raise", 2 * BIG_BET)
+    assert resolver._street_position(state, hero) == (BIG_BET, 2, 0)
+
+    # Earlier streets do not count
+    state.next_round()
+    assert resolver._street_position(state, hero) == (0, 0, 0)
+
+
+def test_terminal_values():
+    showdown = _Showdown([[1.0, 0.0]], [[0.75, 0.0]])
+    pot = 100
+
+    node = _Node(hero_in=20, opp_in=20)
+    hero_values, opp_values = SubgameResolver._terminal_values(node, [1.0], [1.0, 1.0], pot, showdown)
+    assert hero_values == [pytest.approx(140 * 0.75 - 20)]
+    assert opp_values == [pytest.approx(20 - 140 * 0.75), 0.0]
+
+    hero_values, opp_values = SubgameResolver._terminal_values(
+        _Node(fold_by=HERO, hero_in=20, opp_in=40), [1.0], [1.0, 1.0], pot, showdown)
+    assert hero_values == [-20]
+    assert opp_values == [20, 0]
+
+    hero_values, opp_values = SubgameResolver._terminal_values(
+        _Node(fold_by=OPP, hero_in=40, opp_in=20), [0.5], [1.0, 1.0], pot, showdown)
+    assert hero_values == [120]
+    assert opp_values == [-60, 0]
+
+
+def test_seventh_street_equities():
+    resolver = SubgameResolver(BIG_BET, seed=0)
+    hole = tuple(sorted(cards("2c 3d 4h"), key=str))
+    showdown = resolver._showdown_matrices(
+        "seventh_street", [hole], cards("5s 7c 9d Jh"),
+        [tuple(cards("Kc Kd 2s")), tuple(cards("Kh Ks 2c"))], cards("Ac Ad Ah As"),
+        {str(card) for card in cards("5s 7c 9d Jh Ac Ad Ah As")}, float("inf"))
+    assert showdown.blocked == [[1.0, 0.0]]
+    assert showdown.wins == [[0.0, 0.0]]
+
+
+def test_showdown_pooled():
+    showdown = _Showdown([[1.0, 0.0, 1.0], [1.0, 1.0, 1.0]], [[0.5, 0.0, 1.0], [0.0, 1.0, 1.0]])
+    pooled = showdown.pooled([2], [1, 2])
+    assert pooled.blocked == [[1.0, 0.75]]
+    assert pooled.wins == [[0.25, 0.75]]
+    assert pooled.wins_t == [[0.25], [0.75]]
+
+
+def test_bucket_keeps_included_combo_and_weight():
+    resolver = SubgameResolver(BIG_BET, seed=0)
+    up = cards("5s 7c 9d Jh")
+    combos = resolver._sample_combos([card for card in CARDS if card not in up], 3, 200, include=("2c", "3d", "4h"))
+    weights = [1.0] * len(combos)
+    groups = resolver._bucket(combos, weights, up, 12, include=("2c", "3d", "4h"))
+    assert 1 < len(groups) <= 12
+    assert sum(weight for _, weight in groups) == pytest.approx(200)
+    assert all(len(samples) <= resolver.bucket_samples for samples, _ in groups)
+    assert sum(samples[0] == ("2c", "3d", "4h") for samples, _ in groups) == 1
+
+    # Combos left out of the range are not sampled, except the included one
+    groups = resolver._bucket(combos, [0.0] * len(combos), up, 12, include=("2c", "3d", "4h"))
+    assert groups == [([("2c", "3d", "4h")], 0.0)]
+
+
+def test_folds_beaten_hand_facing_bet():
+    # Visible quad aces beat every hand the player could hold
+    state, hero, opponent = make_state("2c 3d 4h", "5s 7c 9d Jh", "Ac Ad Ah As")
+    state.add_action(opponent, "raise", BIG_BET)
+    state.update_pot(BIG_BET)
+    resolver = SubgameResolver(BIG_BET, time_budget=1.0, seed=0)
+    strategy = resolver.resolve(state, hero)
+    assert resolver.last_iterations >= resolver.min_iterations
+    assert strategy["fold"] > 0.99
+
+
+def test_never_folds_the_nuts():
+    state, hero, opponent = make_state("As 2c 3d", "Ts Js Qs Ks", "4c 6d 8h 9c")
+    state.add_action(opponent, "raise", BIG_BET)
+    state.update_pot(BIG_BET)
+    strategy = SubgameResolver(BIG_BET, time_budget=1.0, seed=0).resolve(state, hero)
+    assert set(strategy) == {"fold", "call", "raise"}
+    assert strategy["fold"] < 0.01
+
+
+def test_fallback_before_late_streets():
+    state, hero, opponent = make_state("2c 3d 4h", "5s 7c 9d Jh", "Ac Ad Ah As", street="fifth_street")
+    assert SubgameResolver(BIG_BET).resolve(state, hero) is None
+
+
+def test_fallback_multiway():
+    state, hero, opponent = make_state("2c 3d 4h", "5s 7c 9d Jh", "Ac Ad Ah As")
+    beliefs = {opponent.name: {tuple(cards("Kc Kd Ks")): 1.0}, "Other": {tuple(cards("Qc Qd Qs")): 1.0}}
+    assert SubgameResolver(BIG_BET).resolve(state, hero, beliefs) is None
+
+    state.players.append(Player("Other", 1000, model=None))
+    assert SubgameResolver(BIG_BET).resolve(state, hero) is None
+
+
+def test_fallback_when_budget_expires():
+    state, hero, opponent = make_state("2c 3d 4h", "5s 7c 9d Jh", "Ac Ad Ah As")
+    resolver = SubgameResolver(BIG_BET, time_budget=0.0)
+    assert resolver.resolve(state, hero) is None
+    assert resolver.last_iterations < resolver.min_iterations
+
+
+def test_resolving_player_acts_from_resolve():
+    state, hero, opponent = make_state("2c 3d 4h", "5s 7c 9d Jh", "Ac Ad Ah As")
+    state.add_action(opponent, "raise", BIG_BET)
+    state.update_pot(BIG_BET)
+    player = ResolvingPlayer(hero.name, 1000, None, SubgameResolver(BIG_BET, time_budget=1.0, seed=0))
+    player.hand = hero.hand
+    state.players[0] = player
+    action = player.take_action(BIG_BET, state.pot, [], ["fold", "call", "raise"], state=state)
+    assert action == "fold"
+    assert player.action_history == ["fold"]
+
+
+def test_strategy_is_stable_across_seeds():
+    strategies = []
+    for seed in range(5):
+        state, hero, opponent = make_state("Tc 3d 2h", "Ts 7c 9d Jh", "Qc 5d 8h 4c")
+        state.add_action(opponent, "raise", BIG_BET)
+        state.update_pot(BIG_BET)
+        resolver = SubgameResolver(BIG_BET, time_budget=1.0, seed=seed)
+        strategies.append(resolver.resolve(state, hero))
+        assert resolver.last_exploitability <= resolver.tolerance * state.pot
+
+    for action in ("fold", "call", "raise"):
+        probabilities = [strategy[action] for strategy in strategies]
+        assert max(probabilities) - min(probabilities) < 0.05
@@ -0,0 +1,41 @@
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def loaded_modules(code):
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    script = f"import sys, json\n{code}\nprint(json.dumps(sorted(sys.modules)))"
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, env=env, check=True)
+    return set(json.loads(result.stdout))
+
+
+def test_rules_path_does_not_import_torch():
+    modules = loaded_modules("import Game.game, Game.state, Game.deck")
+    assert "torch" not in modules
+    assert "eval7" not in modules
+
+
+def test_deal_does_not_import_eval7():
+    modules = loaded_modules("from Game.deck import Deck\nassert len(Deck().deal(7)) == 7")
+    assert "eval7" not in modules
+
+
+def test_package_import_is_lazy():
+    modules = loaded_modules("import Game\nGame.Game\nGame.GameState\nGame.Player\nGame.StrategyTable")
+    assert "torch" not in modules
+    assert "Game.nn" not in modules
+
+
+def test_main_imports_without_torch():
+    assert "torch" not in loaded_modules("import main")
+
+
+def test_cli_meets_default_budget():
+    result = subprocess.run([sys.executable, "-m", "Game", "--runs", "3"], capture_output=True, text=True,
+                            cwd=ROOT, env=dict(os.environ, PYTHONPATH=ROOT))
+    assert result.returncode == 0, result.stdout
+    assert "Heavy dependencies loaded: none" in result.stdout
@@ -0,0 +1,168 @@
+import itertools
+import random
+import struct
+
+import pytest
+
+from Game.strategy_table import (
+    QUANT_SCALE,
+    StrategyTable,
+    TablePlayer,
+    _LittleEndianIds,
+    abstract_info_sets,
+    aggregate_policy,
+    export_strategy_table,
+    info_set_key,
+    model_policy,
+    quantize,
+)
+
+
+class NativeInfoSet:
+    # Stands in for a CFR info set object: hashable, but not an abstracted key
+    def __init__(self, hand, upcards, current_bet, pot, history):
+        self.hand, self.upcards, self.current_bet, self.pot, self.history = hand, upcards, current_bet, pot, history
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "strategy.tbl"
+    strategies = {
+        info_set: {"fold": 0.1, "call": 0.3, "raise": 0.6} if i % 2 else {"call": 1.0}
+        for i, info_set in enumerate(itertools.islice(abstract_info_sets(), 5000))
+    }
+    n_info_sets = export_strategy_table(path, strategies.get, info_sets=strategies)
+
+    with StrategyTable(path) as table:
+        assert n_info_sets == len(table) == len(strategies)
+        assert table.actions == ["fold", "call", "raise"]
+        for info_set, strategy in list(strategies.items())[:50]:
+            looked_up = table.lookup(info_set)
+            for action in table.actions:
+                assert looked_up[action] == pytest.approx(strategy.get(action, 0.0), abs=1 / QUANT_SCALE)
+        assert table.lookup("not an info set") is None
+
+
+def test_policy_none_skips_info_set(tmp_path):
+    path = tmp_path / "strategy.tbl"
+    keep = info_set_key(["As", "Ad", "3c"], [["Kc"]], 0, 10)
+    assert export_strategy_table(path, lambda info_set: {"raise": 1.0} if info_set == keep else None) == 1
+
+    with StrategyTable(path) as table:
+        assert table.lookup(keep) == {"fold": 0.0, "call": 0.0, "raise": 1.0}
+
+
+def test_empty_table(tmp_path):
+    path = tmp_path / "strategy.tbl"
+    assert export_strategy_table(path, lambda info_set: None) == 0
+
+    with StrategyTable(path) as table:
+        assert len(table) == 0
+        assert table.lookup(info_set_key(["As", "Ad", "3c"], [["Kc"]], 0, 10)) is None
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "strategy.tbl"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        StrategyTable(path)
+
+
+def test_quantize_sums_to_scale():
+    rng = random.Random(0)
+    for _ in range(1000):
+        probabilities = [rng.random() for _ in range(rng.randint(1, 5))]
+        assert sum(quantize(probabilities)) == QUANT_SCALE
+    assert list(quantize([0.0, 0.0, 0.0])) == [85, 85, 85]
+    assert list(quantize([1 / 3, 1 / 3, 1 / 3])) == [85, 85, 85]
+
+
+def test_info_set_key_is_enumerated():
+    info_sets = set(abstract_info_sets())
+    hands = [
+        ["As", "Ad", "3c"],
+        ["2c", "3d", "4h", "5s", "7c", "Kd"],
+        ["Kc", "Kd", "Ks", "Qc", "Qd", "2h", "3h"],
+        ["9c", "9d", "9h", "9s", "Tc"],
+    ]
+    for hand in hands:
+        n_up = len(hand) - 2 if len(hand) < 7 else 4
+        boards = [[], [["Ac", "Ad", "Ah", "As"][:n_up]], [["2c", "7d", "2h", "7s"][:n_up], ["Kc"]]]
+        for opponent_upcards, (current_bet, pot) in itertools.product(boards, [(0, 0), (0, 40), (10, 40), (100, 40)]):
+            assert info_set_key(hand, opponent_upcards, current_bet, pot) in info_sets
+
+
+def test_info_set_key_ignores_card_order():
+    assert info_set_key(["As", "2d", "3c"], [["Kc"]], 10, 40) == info_set_key(["2d", "As", "3c"], [["Kc"]], 10, 40)
+
+
+def test_info_set_key_separates_upcards():
+    # Same cards, but the pair is hidden in one hand and showing in the other
+    hidden = info_set_key(["Kc", "Kd", "7s", "2h"], [["Qc", "5d"]], 10, 40)
+    showing = info_set_key(["7s", "2h", "Kc", "Kd"], [["Qc", "5d"]], 10, 40)
+    assert hidden != showing
+
+    # The strongest opponent board is part of the key
+    paired_board = info_set_key(["Kc", "Kd", "7s", "2h"], [["Qc", "5d"], ["Ac", "Ad"]], 10, 40)
+    assert paired_board != hidden
+
+
+def test_info_set_key_rejects_bad_hand_sizes():
+    for hand in [[], ["As", "Ad"], ["2c", "3c", "4c", "5c", "6c", "7c", "8c", "9c"]]:
+        with pytest.raises(ValueError):
+            info_set_key(hand, [], 0, 10)
+
+
+def test_little_endian_ids():
+    ids = [1, 2 ** 40 + 3, 2 ** 64 - 1]
+    decoded = _LittleEndianIds(memoryview(struct.pack("<3Q", *ids)))
+    assert len(decoded) == 3
+    assert [decoded[i] for i in range(3)] == ids
+
+
+def test_table_player_uses_exported_entry(tmp_path):
+    path = tmp_path / "strategy.tbl"
+    hand = ["Kc", "Kd", "7s", "2h"]
+    target = info_set_key(hand, [["Qc", "5d"]], 10, 40)
+    export_strategy_table(path, lambda info_set: {"raise": 1.0} if info_set == target else {"fold": 1.0},
+                          info_sets=[target, info_set_key(hand, [["Ac", "Ad"]], 10, 40)])
+
+    with StrategyTable(path) as table:
+        player = TablePlayer("Alice", 100, table)
+        player.hand = hand
+        actions = [player.take_action(10, 40, ["Qc", "5d"], ["fold", "call", "raise"]) for _ in range(20)]
+    assert actions == ["raise"] * 20
+    assert player.action_history == actions
+
+
+def test_export_from_native_info_sets(tmp_path):
+    path = tmp_path / "strategy.tbl"
+    # Two histories that abstract to the same key, and a third hand on its own key
+    strong = NativeInfoSet(["Kc", "Kd", "7s", "2h"], ["Qc", "5d"], 10, 40, ("raise",))
+    strong_checked = NativeInfoSet(["Kd", "Kc", "7s", "2h"], ["Qc", "5d"], 10, 40, ("check", "raise"))
+    weak = NativeInfoSet(["2c", "9d", "7s", "3h"], ["Ac", "Ad"], 10, 40, ("raise",))
+    strategies = {
+        strong: {"call": 0.5, "raise": 0.5},
+        strong_checked: {"raise": 1.0},
+        weak: {"fold": 1.0},
+    }
+    policy = aggregate_policy(strategies, lambda s: (s.hand, [s.upcards], s.current_bet, s.pot))
+
+    assert export_strategy_table(path, policy) == 2
+    with StrategyTable(path) as table:
+        strong_key = info_set_key(strong.hand, [strong.upcards], 10, 40)
+        expected = {"fold": 0.0, "call": 0.25, "raise": 0.75}
+        assert table.lookup(strong_key) == pytest.approx(expected, abs=1 / QUANT_SCALE)
+        assert table.lookup(info_set_key(weak.hand, [weak.upcards], 10, 40)) == {"fold": 1.0, "call": 0.0, "raise": 0.0}
+
+
+def test_export_from_model(tmp_path):
+    torch = pytest.importorskip("torch")
+    from Game.nn import DeepCFRModel
+
+    torch.manual_seed(0)
+    model = DeepCFRModel(n_card_types=2, n_bets=3, n_actions=3, dim=16)
+    path = tmp_path / "strategy.tbl"
+    n_info_sets = export_strategy_table(path, model_policy(model, deals=2000, batch_size=256, seed=0))
+    assert n_info_sets > 0
+    with StrategyTable(path) as table:
+        assert len(table) == n_info_sets
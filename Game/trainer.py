@@ -1,10 +1,5 @@
+import random
 import torch
-from regret import CFR
-from state import GameState
-from nn import DeepCFRModel
-from game import Game
-from player import Player
-from deck import Deck
 
 class Trainer:
     def __init__(self, game, cfr, model, optimizer, iterations, batch_size, device="cpu"):
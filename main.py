@@ -1,13 +1,17 @@
-from game import Game
-from player import Player
-from deck import Deck
-from regret import CFR
-from trainer import Trainer
-from nn import DeepCFRModel
-import torch
+from Game.game import Game
+from Game.player import Player
+from Game.deck import Deck
+from Game.strategy_table import export_strategy_table, model_policy
 
 
 def main():
+    # Training dependencies are imported here so that importing this module stays torch-free.
+    # Game.regret does not implement CFR yet, so training fails at this import until it does.
+    import torch
+    from Game.nn import DeepCFRModel
+    from Game.regret import CFR
+    from Game.trainer import Trainer
+
     # Initialize the deck and players
     deck = Deck()
     players = [
@@ -45,6 +49,11 @@ def main():
     for info_set, strategy in cfr.nash_equilibrium.items():
         print(f"Information Set: {info_set}, Strategy: {strategy}")
 
+    # Export the trained model's strategies over the abstracted info sets as a memory-mapped lookup table
+    table_path = "strategy.tbl"
+    n_info_sets = export_strategy_table(table_path, model_policy(model, chips=1000))
+    print(f"Exported {n_info_sets} information sets to {table_path}.")
+
     # Optionally, simulate a game with trained strategies
     print("Simulating a game with trained strategies...")
     game.play_hand()